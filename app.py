@@ -5,8 +5,10 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import warnings
+import io
 import os
 warnings.filterwarnings('ignore')
 
@@ -40,26 +42,54 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
+# LASS service-quality questions used to build the rating score
+LASS_SERVICE_COLUMNS = [
+    'Interaction with Security Guards',
+    'Interaction with Reception Staff',
+    'Interaction with Frontline Staff',
+    'Does Facility have signs posted notifying clients \nto the right of interpretation services?',
+    'Did the Secret Shopper receive the informat\nion or service asked for?'
+]
+
+# Low-cardinality LASS columns parsed straight into categoricals
+LASS_DTYPES = {
+    col: 'category'
+    for col in ['Agency', 'Borough', 'Secret Shopper Language'] + LASS_SERVICE_COLUMNS
+}
+
+def fetch_csv(url, dtype=None):
+    """Download a CSV over compressed HTTP and parse it with the multi-threaded pyarrow reader"""
+    response = requests.get(url, headers={'Accept-Encoding': 'gzip, deflate'}, timeout=120)
+    response.raise_for_status()
+    return pd.read_csv(io.BytesIO(response.content), engine='pyarrow', dtype=dtype)
+
 def load_lass_data():
     """Load LASS Ratings Dataset with error handling"""
     try:
         lass_url = "https://data.cityofnewyork.us/api/views/3m3d-zzwn/rows.csv?accessType=DOWNLOAD"
-        lass_df = pd.read_csv(lass_url)
+        lass_df = fetch_csv(lass_url, dtype=LASS_DTYPES)
         return lass_df, None
     except Exception as e:
         return None, f"Error loading LASS data: {str(e)}"
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_lep_data():
     """Load LEP Population Dataset with error handling"""
     try:
         lep_url = "https://data.cityofnewyork.us/api/views/ajin-gkbp/rows.csv?accessType=DOWNLOAD"
-        lep_df = pd.read_csv(lep_url)
+        lep_df = fetch_csv(lep_url)
         return lep_df, None
     except Exception as e:
         return None, f"Error loading LEP data: {str(e)}"
 
+@st.cache_data(ttl=3600)  # Cache for 1 hour
+def load_api_data():
+    """Download the LASS and LEP datasets concurrently"""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        lass_future = executor.submit(load_lass_data)
+        lep_future = executor.submit(load_lep_data)
+        return lass_future.result(), lep_future.result()
+
+@st.cache_data(ttl=3600, show_spinner=False)  # Skip re-cleaning on every rerun
 def clean_lass_data(df):
     """Clean and prepare LASS data"""
     if df is None:
@@ -71,31 +101,46 @@ def clean_lass_data(df):
     # Clean column names
     df.columns = df.columns.str.strip()
     
-    # Handle missing values
-    df = df.fillna('Unknown')
+    # Handle missing values in text columns only
+    # (categoricals need 'Unknown' registered as a category before filling)
+    text_cols = [col for col in df.select_dtypes(include=['object', 'string', 'category']).columns
+                 if df[col].isna().any()]
+    for col in text_cols:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and 'Unknown' not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories('Unknown')
+    df[text_cols] = df[text_cols].fillna('Unknown')
+    
+    # Store the low-cardinality filter columns as categoricals, with their categories
+    # sorted once so the sidebar can list them as-is
+    for col in ('Agency', 'Borough', 'Secret Shopper Language'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+            df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories))
     
     # Create a rating score based on service quality indicators
-    # Convert 'Yes'/'No' responses to numeric scores
-    service_columns = [
-        'Interaction with Security Guards',
-        'Interaction with Reception Staff', 
-        'Interaction with Frontline Staff',
-        'Does Facility have signs posted notifying clients \nto the right of interpretation services?',
-        'Did the Secret Shopper receive the informat\nion or service asked for?'
-    ]
-    
-    # Create a simple rating score (1-5 scale)
-    df['rating_score'] = 3  # Default score
-    
-    for col in service_columns:
+    # Convert 'Yes'/'No' responses to numeric scores (1-5 scale)
+    positive_terms = ('yes', 'good', 'excellent')
+    negative_terms = ('no', 'poor', 'bad')
+    codes = np.zeros((len(LASS_SERVICE_COLUMNS), len(df)), dtype=np.int8)
+
+    for i, col in enumerate(LASS_SERVICE_COLUMNS):
         if col in df.columns:
-            # Add points for positive interactions
-            df.loc[df[col].str.contains('Yes|Good|Excellent', case=False, na=False), 'rating_score'] += 0.5
-            # Subtract points for negative interactions
-            df.loc[df[col].str.contains('No|Poor|Bad', case=False, na=False), 'rating_score'] -= 0.5
-    
+            # Code each distinct answer once with plain substring checks:
+            # +1 for positive interactions, -1 for negative ones (0 if both or neither)
+            answers = df[col].astype('category')
+            delta = np.zeros(len(answers.cat.categories) + 1, dtype=np.int8)  # last slot: missing (code -1)
+            for j, value in enumerate(answers.cat.categories):
+                text = value.lower() if isinstance(value, str) else ''
+                delta[j] = (any(term in text for term in positive_terms)
+                            - any(term in text for term in negative_terms))
+            # Gather the per-row scores through the integer category codes
+            codes[i] = delta[answers.cat.codes.to_numpy()]
+
+    # Each code is worth half a point around the default score of 3
+    score = 3.0 + 0.5 * codes.sum(axis=0)
+
     # Cap the rating between 1 and 5
-    df['rating_score'] = df['rating_score'].clip(1, 5)
+    df['rating_score'] = np.clip(score, 1, 5)
     
     return df
 
@@ -130,6 +175,7 @@ def load_local_excel_files():
     
     return data
 
+@st.cache_data(ttl=3600, show_spinner=False)  # Skip re-cleaning on every rerun
 def clean_lep_data(df):
     """Clean and prepare LEP data"""
     if df is None:
@@ -141,19 +187,375 @@ def clean_lep_data(df):
     # Clean column names
     df.columns = df.columns.str.strip()
     
-    # Handle missing values
-    df = df.fillna('Unknown')
-    
-    # Convert LEP population to numeric
+    # Convert LEP population to numeric (before filling, so missing estimates stay NaN)
     if 'LEP Population (Estimate)' in df.columns:
         df['LEP Population (Estimate)'] = pd.to_numeric(df['LEP Population (Estimate)'], errors='coerce')
     
+    # Handle missing values in text columns only
+    text_cols = df.select_dtypes(include=['object', 'string']).columns
+    df[text_cols] = df[text_cols].fillna('Unknown')
+    
     return df
 
+def sidebar_options(df):
+    """Sidebar choices for each LASS filter column, read from the (pre-sorted) category index"""
+    return {
+        col: list(df[col].cat.categories)
+        for col in ('Agency', 'Borough', 'Secret Shopper Language')
+        if col in df.columns
+    }
+
+@st.cache_data(show_spinner=False)
+def filter_lass(df, agencies, boroughs, languages):
+    """Filter LASS data by the sidebar selections (passed as tuples)"""
+    # Combine the selections into one mask and gather the rows once
+    mask = np.ones(len(df), dtype=bool)
+    
+    if agencies:
+        mask &= df['Agency'].isin(agencies).to_numpy()
+    
+    if boroughs:
+        mask &= df['Borough'].isin(boroughs).to_numpy()
+    
+    if languages:
+        mask &= df['Secret Shopper Language'].isin(languages).to_numpy()
+    
+    return df.iloc[mask]
+
+def top_category_counts(series, n=10):
+    """Return the n most frequent categories of a column and its number of distinct values"""
+    series = series.astype('category')  # No-op for the columns parsed as categoricals at load time
+    
+    # One bincount over the integer codes, then a full sort of the few category counts:
+    # by count, ties broken by category order (alphabetical for the sorted filter columns)
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    n_distinct = int(np.count_nonzero(counts))
+    k = min(n, n_distinct)
+    
+    top = np.lexsort((np.arange(len(counts)), -counts))[:k]
+    
+    return pd.Series(counts[top], index=series.cat.categories[top], name='count'), n_distinct
+
+@st.cache_data(show_spinner=False)
+def precompute_counts(df):
+    """Compute the KPI values and chart counts for filtered LASS data in one place"""
+    counts = {
+        'n_agencies': "N/A",
+        'n_languages': "N/A",
+        'avg_rating': None,
+        'total': len(df),
+        'agency_top10': None,
+        'lang_top10': None
+    }
+    
+    # A column missing from the download leaves its KPI at "N/A" and its chart as a warning
+    if 'Agency' in df.columns:
+        counts['agency_top10'], counts['n_agencies'] = top_category_counts(df['Agency'])
+    
+    if 'Secret Shopper Language' in df.columns:
+        counts['lang_top10'], counts['n_languages'] = top_category_counts(df['Secret Shopper Language'])
+    
+    if 'rating_score' in df.columns and len(df):
+        counts['avg_rating'] = df['rating_score'].to_numpy().mean()
+    
+    return counts
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Serialize a frame for a download button, re-encoding only when the frame changes"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def make_agency_bar(names, values):
+    """Build the top agencies bar chart, cached on the counts it plots"""
+    values = np.asarray(values)
+    fig = px.bar(
+        x=values,
+        y=np.asarray(names),
+        orientation='h',
+        title="Top 10 Agencies by Service Count",
+        labels={'x': 'Number of Services', 'y': 'Agency'},
+        color=values,
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(height=400, showlegend=False)
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_language_pie(names, values):
+    """Build the top languages pie chart, cached on the counts it plots"""
+    fig = px.pie(
+        values=np.asarray(values),
+        names=np.asarray(names),
+        title="Top 10 Languages by Service Availability",
+        hole=0.4
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.fragment
+def show_paginated(df, key, page_size=1000):
+    """Display one page of a large frame so only that slice is sent to the browser"""
+    n_pages = max(1, -(-len(df) // page_size))
+    if n_pages > 1:
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, key=key)
+    else:
+        page = 1
+    
+    st.dataframe(df.iloc[(page - 1) * page_size:page * page_size], use_container_width=True)
+
+@st.fragment
+def trends_panel(hist_data):
+    """Time range selection and trend charts; date changes rerun only this panel"""
+    # Time range filter
+    st.markdown("### ⏰ Select Time Range")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if 'Request Date' in hist_data.columns:
+            min_date = hist_data['Request Date'].min()
+            max_date = hist_data['Request Date'].max()
+            
+            if pd.notna(min_date) and pd.notna(max_date):
+                start_date = st.date_input(
+                    "Start Date",
+                    value=max_date - timedelta(days=365),
+                    min_value=min_date.date(),
+                    max_value=max_date.date()
+                )
+            else:
+                start_date = st.date_input("Start Date")
+    
+    with col2:
+        if 'Request Date' in hist_data.columns and pd.notna(max_date):
+            end_date = st.date_input(
+                "End Date",
+                value=max_date.date(),
+                min_value=min_date.date() if pd.notna(min_date) else None,
+                max_value=max_date.date()
+            )
+        else:
+            end_date = st.date_input("End Date")
+    
+    # Filter data by date range
+    if 'Request Date' in hist_data.columns:
+        mask = (hist_data['Request Date'].dt.date >= start_date) & (hist_data['Request Date'].dt.date <= end_date)
+        filtered_hist = hist_data[mask].copy()
+    else:
+        filtered_hist = hist_data.copy()
+    
+    # Trend visualizations
+    st.markdown("---")
+    
+    # Requests over time
+    if 'Request Date' in filtered_hist.columns:
+        st.markdown("### 📊 Service Requests Over Time")
+        
+        # Group by month
+        monthly_requests = filtered_hist.groupby(filtered_hist['Request Date'].dt.to_period('M')).size()
+        monthly_requests.index = monthly_requests.index.to_timestamp()
+        
+        fig_trend = px.line(
+            x=monthly_requests.index.to_numpy(),
+            y=monthly_requests.to_numpy(),
+            title="Monthly Service Requests",
+            labels={'x': 'Month', 'y': 'Number of Requests'}
+        )
+        fig_trend.update_traces(mode='lines+markers')
+        st.plotly_chart(fig_trend, use_container_width=True)
+    
+    # Language trends
+    if 'Language' in filtered_hist.columns and 'Request Date' in filtered_hist.columns:
+        st.markdown("### 🌍 Language Request Trends")
+        
+        # Top languages over time
+        top_languages = filtered_hist['Language'].value_counts().head(5).index
+        lang_trend_data = []
+        
+        for lang in top_languages:
+            lang_data = filtered_hist[filtered_hist['Language'] == lang]
+            monthly = lang_data.groupby(lang_data['Request Date'].dt.to_period('M')).size()
+            monthly.index = monthly.index.to_timestamp()
+            
+            for date, count in monthly.items():
+                lang_trend_data.append({
+                    'Date': date,
+                    'Language': lang,
+                    'Count': count
+                })
+        
+        if lang_trend_data:
+            lang_trend_df = pd.DataFrame(lang_trend_data)
+            
+            fig_lang_trend = px.line(
+                lang_trend_df,
+                x='Date',
+                y='Count',
+                color='Language',
+                title="Top 5 Languages - Request Trends",
+                labels={'Count': 'Number of Requests', 'Date': 'Month'}
+            )
+            st.plotly_chart(fig_lang_trend, use_container_width=True)
+    
+    # Linguist availability trends
+    if 'Has Linguist?' in filtered_hist.columns:
+        st.markdown("### 👥 Linguist Availability Trends")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Overall availability
+            availability_counts = filtered_hist['Has Linguist?'].value_counts()
+            
+            fig_avail = px.pie(
+                values=availability_counts.to_numpy(),
+                names=availability_counts.index.to_numpy(),
+                title="Overall Linguist Availability",
+                color_discrete_map={'Yes': '#2E7D32', 'No': '#D32F2F'}
+            )
+            st.plotly_chart(fig_avail, use_container_width=True)
+        
+        with col2:
+            # Availability by language
+            if 'Language' in filtered_hist.columns:
+                lang_avail = filtered_hist.groupby(['Language', 'Has Linguist?']).size().unstack(fill_value=0)
+                lang_avail['Total'] = lang_avail.sum(axis=1)
+                lang_avail['Availability %'] = (lang_avail.get('Yes', 0) / lang_avail['Total'] * 100).round(1)
+                
+                top_lang_avail = lang_avail.nlargest(10, 'Total')
+                
+                fig_lang_avail = px.bar(
+                    x=top_lang_avail.index.to_numpy(),
+                    y=top_lang_avail['Availability %'].to_numpy(),
+                    title="Linguist Availability by Top 10 Languages",
+                    labels={'x': 'Language', 'y': 'Availability %'},
+                    color=top_lang_avail['Availability %'].to_numpy(),
+                    color_continuous_scale='RdYlGn'
+                )
+                fig_lang_avail.add_hline(y=50, line_dash="dash", annotation_text="50% threshold")
+                st.plotly_chart(fig_lang_avail, use_container_width=True)
+
+@st.fragment
+def linguist_panel(linguists_df):
+    """Linguist filters, charts and table; filter changes rerun only this panel"""
+    # Filters for linguist directory
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if 'Languages' in linguists_df.columns:
+            unique_languages = sorted(linguists_df['Languages'].dropna().unique())
+            selected_ling_language = st.selectbox(
+                "Filter by Language",
+                ["All"] + unique_languages
+            )
+    
+    with col2:
+        if 'State' in linguists_df.columns:
+            unique_states = sorted(linguists_df['State'].dropna().unique())
+            selected_state = st.selectbox(
+                "Filter by State",
+                ["All"] + unique_states
+            )
+    
+    with col3:
+        if 'Proficiency' in linguists_df.columns:
+            unique_prof = sorted(linguists_df['Proficiency'].dropna().unique())
+            selected_prof = st.selectbox(
+                "Filter by Proficiency",
+                ["All"] + unique_prof
+            )
+    
+    # Apply filters
+    filtered_linguists = linguists_df.copy()
+    
+    if selected_ling_language != "All":
+        filtered_linguists = filtered_linguists[filtered_linguists['Languages'] == selected_ling_language]
+    
+    if selected_state != "All":
+        filtered_linguists = filtered_linguists[filtered_linguists['State'] == selected_state]
+    
+    if selected_prof != "All":
+        filtered_linguists = filtered_linguists[filtered_linguists['Proficiency'] == selected_prof]
+    
+    # Summary statistics
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Linguists", len(filtered_linguists))
+    
+    with col2:
+        if 'Languages' in filtered_linguists.columns:
+            st.metric("Languages Covered", filtered_linguists['Languages'].nunique())
+    
+    with col3:
+        if 'State' in filtered_linguists.columns:
+            st.metric("States Represented", filtered_linguists['State'].nunique())
+    
+    with col4:
+        if 'Rate' in filtered_linguists.columns:
+            avg_rate = pd.to_numeric(filtered_linguists['Rate'], errors='coerce').mean()
+            if not pd.isna(avg_rate):
+                st.metric("Average Rate", f"${avg_rate:.2f}")
+    
+    # Visualizations
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Languages Distribution")
+        if 'Languages' in filtered_linguists.columns:
+            lang_counts = filtered_linguists['Languages'].value_counts().head(15)
+            
+            fig_lang_dist = px.bar(
+                y=lang_counts.index.to_numpy(),
+                x=lang_counts.to_numpy(),
+                orientation='h',
+                title="Top 15 Languages by Linguist Count",
+                labels={'x': 'Number of Linguists', 'y': 'Language'}
+            )
+            st.plotly_chart(fig_lang_dist, use_container_width=True)
+    
+    with col2:
+        st.markdown("#### Geographic Distribution")
+        if 'State' in filtered_linguists.columns:
+            state_counts = filtered_linguists['State'].value_counts()
+            
+            fig_state_dist = px.pie(
+                values=state_counts.to_numpy(),
+                names=state_counts.index.to_numpy(),
+                title="Linguists by State",
+                hole=0.4
+            )
+            st.plotly_chart(fig_state_dist, use_container_width=True)
+    
+    # Display linguist table
+    st.markdown("---")
+    st.markdown("### 📋 Linguist Details")
+    
+    # Select columns to display
+    display_columns = ['Languages', 'first_name', 'last_name', 'State', 'Proficiency', 'Rate']
+    display_columns = [col for col in display_columns if col in filtered_linguists.columns]
+    
+    st.dataframe(
+        filtered_linguists[display_columns],
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Download button
+    st.download_button(
+        label="Download Filtered Linguist Data",
+        data=to_csv_bytes(filtered_linguists),
+        file_name="filtered_linguists.csv",
+        mime="text/csv"
+    )
+
 # Load data
 with st.spinner("Loading NYC Language Access Services data..."):
-    lass_df, lass_error = load_lass_data()
-    lep_df, lep_error = load_lep_data()
+    (lass_df, lass_error), (lep_df, lep_error) = load_api_data()
     
 # Load local Excel files
 with st.spinner("Loading local Excel files..."):
@@ -210,9 +612,11 @@ with tab1:
         st.title("🔍 Dashboard Filters")
         st.markdown("---")
         
+        filter_options = sidebar_options(lass_df) if lass_df is not None else {}
+        
         # Agency filter
-        if lass_df is not None and 'Agency' in lass_df.columns:
-            agencies = sorted(lass_df['Agency'].unique())
+        if 'Agency' in filter_options:
+            agencies = filter_options['Agency']
             selected_agencies = st.multiselect(
                 "Select Agencies",
                 agencies,
@@ -222,8 +626,8 @@ with tab1:
             selected_agencies = []
         
         # Borough filter
-        if lass_df is not None and 'Borough' in lass_df.columns:
-            boroughs = sorted(lass_df['Borough'].unique())
+        if 'Borough' in filter_options:
+            boroughs = filter_options['Borough']
             selected_boroughs = st.multiselect(
                 "Select Boroughs",
                 boroughs,
@@ -233,8 +637,8 @@ with tab1:
             selected_boroughs = []
         
         # Language filter
-        if lass_df is not None and 'Secret Shopper Language' in lass_df.columns:
-            languages = sorted(lass_df['Secret Shopper Language'].unique())
+        if 'Secret Shopper Language' in filter_options:
+            languages = filter_options['Secret Shopper Language']
             selected_languages = st.multiselect(
                 "Select Languages",
                 languages,
@@ -245,18 +649,16 @@ with tab1:
     
     # Filter data based on selections
     if lass_df is not None:
-        filtered_lass = lass_df.copy()
-        
-        if selected_agencies:
-            filtered_lass = filtered_lass[filtered_lass['Agency'].isin(selected_agencies)]
-        
-        if selected_boroughs:
-            filtered_lass = filtered_lass[filtered_lass['Borough'].isin(selected_boroughs)]
-        
-        if selected_languages:
-            filtered_lass = filtered_lass[filtered_lass['Secret Shopper Language'].isin(selected_languages)]
+        filtered_lass = filter_lass(
+            lass_df,
+            tuple(selected_agencies),
+            tuple(selected_boroughs),
+            tuple(selected_languages)
+        )
+        lass_counts = precompute_counts(filtered_lass) if not filtered_lass.empty else {}
     else:
         filtered_lass = pd.DataFrame()
+        lass_counts = {}
     
     # Key Metrics Row
     st.markdown("---")
@@ -266,7 +668,7 @@ with tab1:
     
     with col1:
         if not filtered_lass.empty:
-            total_agencies = filtered_lass['Agency'].nunique()
+            total_agencies = lass_counts['n_agencies']
             st.metric(
                 label="Total Agencies",
                 value=total_agencies,
@@ -277,7 +679,7 @@ with tab1:
     
     with col2:
         if not filtered_lass.empty:
-            total_languages = filtered_lass['Secret Shopper Language'].nunique()
+            total_languages = lass_counts['n_languages']
             st.metric(
                 label="Languages Supported",
                 value=total_languages,
@@ -288,7 +690,7 @@ with tab1:
     
     with col3:
         if not filtered_lass.empty and 'rating_score' in filtered_lass.columns:
-            avg_rating = filtered_lass['rating_score'].mean()
+            avg_rating = lass_counts['avg_rating']
             st.metric(
                 label="Average Rating",
                 value=f"{avg_rating:.1f}" if not pd.isna(avg_rating) else "N/A",
@@ -299,7 +701,7 @@ with tab1:
     
     with col4:
         if not filtered_lass.empty:
-            total_services = len(filtered_lass)
+            total_services = lass_counts['total']
             st.metric(
                 label="Total Services",
                 value=total_services,
@@ -318,35 +720,20 @@ with tab1:
     with col1:
         st.markdown("#### 🏢 Agency Performance")
         if not filtered_lass.empty and 'Agency' in filtered_lass.columns:
-            agency_counts = filtered_lass['Agency'].value_counts().head(10)
+            agency_counts = lass_counts['agency_top10']
             
-            fig_agency = px.bar(
-                x=agency_counts.values,
-                y=agency_counts.index,
-                orientation='h',
-                title="Top 10 Agencies by Service Count",
-                labels={'x': 'Number of Services', 'y': 'Agency'},
-                color=agency_counts.values,
-                color_continuous_scale='Blues'
-            )
-            fig_agency.update_layout(height=400, showlegend=False)
-            st.plotly_chart(fig_agency, use_container_width=True)
+            fig_agency = make_agency_bar(tuple(agency_counts.index), tuple(agency_counts.values))
+            st.plotly_chart(fig_agency, use_container_width=True, key="lass_agency_chart")
         else:
             st.warning("Agency data not available for visualization.")
     
     with col2:
         st.markdown("#### 🌍 Language Distribution")
         if not filtered_lass.empty and 'Secret Shopper Language' in filtered_lass.columns:
-            language_counts = filtered_lass['Secret Shopper Language'].value_counts().head(10)
+            language_counts = lass_counts['lang_top10']
             
-            fig_language = px.pie(
-                values=language_counts.values,
-                names=language_counts.index,
-                title="Top 10 Languages by Service Availability",
-                hole=0.4
-            )
-            fig_language.update_layout(height=400)
-            st.plotly_chart(fig_language, use_container_width=True)
+            fig_language = make_language_pie(tuple(language_counts.index), tuple(language_counts.values))
+            st.plotly_chart(fig_language, use_container_width=True, key="lass_language_chart")
         else:
             st.warning("Language data not available for visualization.")
 
@@ -366,133 +753,7 @@ with tab2:
                 if col in hist_data.columns:
                     hist_data[col] = pd.to_datetime(hist_data[col], errors='coerce')
             
-            # Time range filter
-            st.markdown("### ⏰ Select Time Range")
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if 'Request Date' in hist_data.columns:
-                    min_date = hist_data['Request Date'].min()
-                    max_date = hist_data['Request Date'].max()
-                    
-                    if pd.notna(min_date) and pd.notna(max_date):
-                        start_date = st.date_input(
-                            "Start Date",
-                            value=max_date - timedelta(days=365),
-                            min_value=min_date.date(),
-                            max_value=max_date.date()
-                        )
-                    else:
-                        start_date = st.date_input("Start Date")
-            
-            with col2:
-                if 'Request Date' in hist_data.columns and pd.notna(max_date):
-                    end_date = st.date_input(
-                        "End Date",
-                        value=max_date.date(),
-                        min_value=min_date.date() if pd.notna(min_date) else None,
-                        max_value=max_date.date()
-                    )
-                else:
-                    end_date = st.date_input("End Date")
-            
-            # Filter data by date range
-            if 'Request Date' in hist_data.columns:
-                mask = (hist_data['Request Date'].dt.date >= start_date) & (hist_data['Request Date'].dt.date <= end_date)
-                filtered_hist = hist_data[mask].copy()
-            else:
-                filtered_hist = hist_data.copy()
-            
-            # Trend visualizations
-            st.markdown("---")
-            
-            # Requests over time
-            if 'Request Date' in filtered_hist.columns:
-                st.markdown("### 📊 Service Requests Over Time")
-                
-                # Group by month
-                monthly_requests = filtered_hist.groupby(filtered_hist['Request Date'].dt.to_period('M')).size()
-                monthly_requests.index = monthly_requests.index.to_timestamp()
-                
-                fig_trend = px.line(
-                    x=monthly_requests.index,
-                    y=monthly_requests.values,
-                    title="Monthly Service Requests",
-                    labels={'x': 'Month', 'y': 'Number of Requests'}
-                )
-                fig_trend.update_traces(mode='lines+markers')
-                st.plotly_chart(fig_trend, use_container_width=True)
-            
-            # Language trends
-            if 'Language' in filtered_hist.columns and 'Request Date' in filtered_hist.columns:
-                st.markdown("### 🌍 Language Request Trends")
-                
-                # Top languages over time
-                top_languages = filtered_hist['Language'].value_counts().head(5).index
-                lang_trend_data = []
-                
-                for lang in top_languages:
-                    lang_data = filtered_hist[filtered_hist['Language'] == lang]
-                    monthly = lang_data.groupby(lang_data['Request Date'].dt.to_period('M')).size()
-                    monthly.index = monthly.index.to_timestamp()
-                    
-                    for date, count in monthly.items():
-                        lang_trend_data.append({
-                            'Date': date,
-                            'Language': lang,
-                            'Count': count
-                        })
-                
-                if lang_trend_data:
-                    lang_trend_df = pd.DataFrame(lang_trend_data)
-                    
-                    fig_lang_trend = px.line(
-                        lang_trend_df,
-                        x='Date',
-                        y='Count',
-                        color='Language',
-                        title="Top 5 Languages - Request Trends",
-                        labels={'Count': 'Number of Requests', 'Date': 'Month'}
-                    )
-                    st.plotly_chart(fig_lang_trend, use_container_width=True)
-            
-            # Linguist availability trends
-            if 'Has Linguist?' in filtered_hist.columns:
-                st.markdown("### 👥 Linguist Availability Trends")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    # Overall availability
-                    availability_counts = filtered_hist['Has Linguist?'].value_counts()
-                    
-                    fig_avail = px.pie(
-                        values=availability_counts.values,
-                        names=availability_counts.index,
-                        title="Overall Linguist Availability",
-                        color_discrete_map={'Yes': '#2E7D32', 'No': '#D32F2F'}
-                    )
-                    st.plotly_chart(fig_avail, use_container_width=True)
-                
-                with col2:
-                    # Availability by language
-                    if 'Language' in filtered_hist.columns:
-                        lang_avail = filtered_hist.groupby(['Language', 'Has Linguist?']).size().unstack(fill_value=0)
-                        lang_avail['Total'] = lang_avail.sum(axis=1)
-                        lang_avail['Availability %'] = (lang_avail.get('Yes', 0) / lang_avail['Total'] * 100).round(1)
-                        
-                        top_lang_avail = lang_avail.nlargest(10, 'Total')
-                        
-                        fig_lang_avail = px.bar(
-                            x=top_lang_avail.index,
-                            y=top_lang_avail['Availability %'],
-                            title="Linguist Availability by Top 10 Languages",
-                            labels={'x': 'Language', 'y': 'Availability %'},
-                            color=top_lang_avail['Availability %'],
-                            color_continuous_scale='RdYlGn'
-                        )
-                        fig_lang_avail.add_hline(y=50, line_dash="dash", annotation_text="50% threshold")
-                        st.plotly_chart(fig_lang_avail, use_container_width=True)
+            trends_panel(hist_data)
             
         else:
             st.warning("No historical data available for trends analysis.")
@@ -507,119 +768,7 @@ with tab3:
     if local_data.get('linguists') is not None:
         linguists_df = local_data['linguists']
         
-        # Filters for linguist directory
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            if 'Languages' in linguists_df.columns:
-                unique_languages = sorted(linguists_df['Languages'].dropna().unique())
-                selected_ling_language = st.selectbox(
-                    "Filter by Language",
-                    ["All"] + unique_languages
-                )
-        
-        with col2:
-            if 'State' in linguists_df.columns:
-                unique_states = sorted(linguists_df['State'].dropna().unique())
-                selected_state = st.selectbox(
-                    "Filter by State",
-                    ["All"] + unique_states
-                )
-        
-        with col3:
-            if 'Proficiency' in linguists_df.columns:
-                unique_prof = sorted(linguists_df['Proficiency'].dropna().unique())
-                selected_prof = st.selectbox(
-                    "Filter by Proficiency",
-                    ["All"] + unique_prof
-                )
-        
-        # Apply filters
-        filtered_linguists = linguists_df.copy()
-        
-        if selected_ling_language != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['Languages'] == selected_ling_language]
-        
-        if selected_state != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['State'] == selected_state]
-        
-        if selected_prof != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['Proficiency'] == selected_prof]
-        
-        # Summary statistics
-        st.markdown("---")
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Linguists", len(filtered_linguists))
-        
-        with col2:
-            if 'Languages' in filtered_linguists.columns:
-                st.metric("Languages Covered", filtered_linguists['Languages'].nunique())
-        
-        with col3:
-            if 'State' in filtered_linguists.columns:
-                st.metric("States Represented", filtered_linguists['State'].nunique())
-        
-        with col4:
-            if 'Rate' in filtered_linguists.columns:
-                avg_rate = pd.to_numeric(filtered_linguists['Rate'], errors='coerce').mean()
-                if not pd.isna(avg_rate):
-                    st.metric("Average Rate", f"${avg_rate:.2f}")
-        
-        # Visualizations
-        st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### Languages Distribution")
-            if 'Languages' in filtered_linguists.columns:
-                lang_counts = filtered_linguists['Languages'].value_counts().head(15)
-                
-                fig_lang_dist = px.bar(
-                    y=lang_counts.index,
-                    x=lang_counts.values,
-                    orientation='h',
-                    title="Top 15 Languages by Linguist Count",
-                    labels={'x': 'Number of Linguists', 'y': 'Language'}
-                )
-                st.plotly_chart(fig_lang_dist, use_container_width=True)
-        
-        with col2:
-            st.markdown("#### Geographic Distribution")
-            if 'State' in filtered_linguists.columns:
-                state_counts = filtered_linguists['State'].value_counts()
-                
-                fig_state_dist = px.pie(
-                    values=state_counts.values,
-                    names=state_counts.index,
-                    title="Linguists by State",
-                    hole=0.4
-                )
-                st.plotly_chart(fig_state_dist, use_container_width=True)
-        
-        # Display linguist table
-        st.markdown("---")
-        st.markdown("### 📋 Linguist Details")
-        
-        # Select columns to display
-        display_columns = ['Languages', 'first_name', 'last_name', 'State', 'Proficiency', 'Rate']
-        display_columns = [col for col in display_columns if col in filtered_linguists.columns]
-        
-        st.dataframe(
-            filtered_linguists[display_columns],
-            use_container_width=True,
-            hide_index=True
-        )
-        
-        # Download button
-        st.download_button(
-            label="Download Filtered Linguist Data",
-            data=filtered_linguists.to_csv(index=False),
-            file_name="filtered_linguists.csv",
-            mime="text/csv"
-        )
+        linguist_panel(linguists_df)
         
     else:
         st.warning("Linguist directory file not found. Please ensure 'SOSiApprovedLinguists (1).xlsx' is in the same directory as the app.")
@@ -667,11 +816,11 @@ with tab4:
             status_counts = staging_df['Status'].value_counts()
             
             fig_status = px.bar(
-                x=status_counts.index,
-                y=status_counts.values,
+                x=status_counts.index.to_numpy(),
+                y=status_counts.to_numpy(),
                 title="Service Request Status Distribution",
                 labels={'x': 'Status', 'y': 'Count'},
-                color=status_counts.values,
+                color=status_counts.to_numpy(),
                 color_continuous_scale='Viridis'
             )
             st.plotly_chart(fig_status, use_container_width=True)
@@ -684,8 +833,8 @@ with tab4:
                 medium_counts = staging_df['Medium'].value_counts()
                 
                 fig_medium = px.pie(
-                    values=medium_counts.values,
-                    names=medium_counts.index,
+                    values=medium_counts.to_numpy(),
+                    names=medium_counts.index.to_numpy(),
                     title="Service Delivery Medium",
                     hole=0.4
                 )
@@ -720,12 +869,20 @@ with tab4:
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    fig_time_dist = px.histogram(
-                        staging_df[staging_df['Billable time (numeric)'].notna()],
-                        x='Billable time (numeric)',
-                        nbins=30,
+                    # Bin server-side so only the 30 bar heights are sent to the browser
+                    durations = staging_df['Billable time (numeric)'].dropna().to_numpy()
+                    counts, edges = np.histogram(durations, bins=30)
+                    
+                    fig_time_dist = go.Figure(go.Bar(
+                        x=0.5 * (edges[1:] + edges[:-1]),
+                        y=counts,
+                        width=edges[1] - edges[0]
+                    ))
+                    fig_time_dist.update_layout(
                         title="Distribution of Service Duration",
-                        labels={'Billable time (numeric)': 'Duration (minutes)', 'count': 'Frequency'}
+                        xaxis_title='Duration (minutes)',
+                        yaxis_title='Frequency',
+                        bargap=0
                     )
                     st.plotly_chart(fig_time_dist, use_container_width=True)
                 
@@ -734,8 +891,8 @@ with tab4:
                         avg_time_by_lang = staging_df.groupby('Language')['Billable time (numeric)'].mean().sort_values(ascending=False).head(10)
                         
                         fig_avg_time = px.bar(
-                            x=avg_time_by_lang.values,
-                            y=avg_time_by_lang.index,
+                            x=avg_time_by_lang.to_numpy(),
+                            y=avg_time_by_lang.index.to_numpy(),
                             orientation='h',
                             title="Average Service Duration by Language (Top 10)",
                             labels={'x': 'Average Duration (minutes)', 'y': 'Language'}
@@ -751,20 +908,20 @@ with tab4:
     with data_tabs[0]:
         if lass_df is not None:
             st.write("LASS Data")
-            st.dataframe(lass_df, use_container_width=True)
+            show_paginated(lass_df, key="lass_page")
             st.download_button(
                 label="Download LASS Data",
-                data=lass_df.to_csv(index=False),
+                data=to_csv_bytes(lass_df),
                 file_name="lass_data.csv",
                 mime="text/csv"
             )
         
         if lep_df is not None:
             st.write("LEP Data")
-            st.dataframe(lep_df, use_container_width=True)
+            show_paginated(lep_df, key="lep_page")
             st.download_button(
                 label="Download LEP Data",
-                data=lep_df.to_csv(index=False),
+                data=to_csv_bytes(lep_df),
                 file_name="lep_data.csv",
                 mime="text/csv"
             )
@@ -776,7 +933,7 @@ with tab4:
                 st.dataframe(sheet_data, use_container_width=True)
                 st.download_button(
                     label=f"Download {sheet_name}",
-                    data=sheet_data.to_csv(index=False),
+                    data=to_csv_bytes(sheet_data),
                     file_name=f"historical_{sheet_name.replace(' ', '_')}.csv",
                     mime="text/csv"
                 )
@@ -786,7 +943,7 @@ with tab4:
             st.dataframe(local_data['linguists'], use_container_width=True)
             st.download_button(
                 label="Download Linguist Data",
-                data=local_data['linguists'].to_csv(index=False),
+                data=to_csv_bytes(local_data['linguists']),
                 file_name="linguist_data.csv",
                 mime="text/csv"
             )
@@ -796,7 +953,7 @@ with tab4:
             st.dataframe(local_data['staging'], use_container_width=True)
             st.download_button(
                 label="Download Staging Data",
-                data=local_data['staging'].to_csv(index=False),
+                data=to_csv_bytes(local_data['staging']),
                 file_name="staging_data.csv",
                 mime="text/csv"
             )
@@ -5,11 +5,21 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import warnings
+import hashlib
 import os
+import re
 warnings.filterwarnings('ignore')
 
+# Prefer the Rust-based calamine Excel reader; fall back to openpyxl when it isn't installed
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 # Page configuration
 st.set_page_config(
     page_title="SOSI Language Services Dashboard",
@@ -42,43 +52,323 @@ st.markdown("""
 
 # SOSI-specific data loading functions
 
+# Local SOSI Excel files, expected in the current directory
+EXCEL_FILES = {
+    'historical': 'AllDataAnalysis_20250908_194306.xlsx',
+    'linguists': 'SOSiApprovedLinguists (1).xlsx',
+    'staging': 'tblStaging_Raw.xlsx'
+}
+
+# Low-cardinality text columns parsed straight into categoricals, per file
+# (numeric Proficiency stays float64 here so cold and Parquet-cached loads match; clean_linguists categorises it)
+SHEET_DTYPES = {
+    'historical': {'Language': 'category', 'Has Linguist?': 'category'},
+    'linguists': {'Languages': 'category', 'State': 'category'},
+    'staging': {'Language': 'category', 'Status': 'category', 'Medium': 'category'}
+}
+
+# Date columns parsed to datetime64 at load time, per sheet
+SHEET_DATES = {
+    'All Historical Data': ['Request Date', 'Hearing Date', 'Row Added'],
+    'staging': ['Date of request', 'Hearing Date', 'Timestamp']
+}
+
+# Linguist directory columns offered as Tab 3 filters
+LINGUIST_FILTER_COLUMNS = ('Languages', 'State', 'Proficiency')
+
+# A staging Status containing any of these (case-insensitive) counts as a completed service
+COMPLETED_STATUS_KEYWORDS = ('completed', 'done')
+
+# Helper columns added while cleaning; kept out of the Raw Data tables and downloads
+DERIVED_COLUMNS = ['Rate (numeric)', 'is_completed']
+
+# Renderer for the Tab 2 line charts: 'webgl' draws long monthly series on the GPU, 'svg' is the Plotly default
+LINE_RENDER_MODE = 'webgl'
+
+# Parsed sheets are cached here as Parquet, keyed by file contents, sheet, engine and read options
+CACHE_DIR = '.cache'
+
+def file_sha1(filename):
+    """Hash a file's bytes so cache entries are invalidated when it changes"""
+    with open(filename, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def stringify_mixed_columns(df):
+    """Store object columns holding mixed value types (e.g. numeric and text IDs) as strings so they round-trip through Parquet"""
+    for col in df.select_dtypes(include='object').columns:
+        if df[col].dropna().map(type).nunique() > 1:
+            df[col] = df[col].astype(str).where(df[col].notna())
+    return df
+
+def read_excel_cached(filename, sheet_name, cache_name, file_hash, dates=(), **read_kwargs):
+    """Read one Excel sheet through the on-disk Parquet cache, converting the listed date columns it has"""
+    # Sheet names can sanitise to the same string (e.g. "Q1 2024" and "Q1_2024"); a short hash keeps their entries apart
+    safe_name = re.sub(r'[^\w-]+', '_', cache_name) + '_' + hashlib.sha1(cache_name.encode()).hexdigest()[:8]
+    digest = hashlib.sha1(f"{file_hash}{sheet_name!r}{EXCEL_ENGINE}{list(dates)}{sorted(read_kwargs.items())}".encode()).hexdigest()
+    path = os.path.join(CACHE_DIR, f"{safe_name}_{digest}.parquet")
+    
+    if os.path.exists(path):
+        try:
+            df = pd.read_parquet(path)
+            # Parquet hands back missing text as None on pandas 2.x; restore the NaN a fresh parse gives
+            text_cols = df.select_dtypes(include='object').columns
+            df[text_cols] = df[text_cols].where(df[text_cols].notna(), np.nan)
+            return df
+        except Exception:
+            pass  # Unreadable entry: re-parse the sheet and overwrite it
+    
+    df = pd.read_excel(filename, sheet_name=sheet_name, engine=EXCEL_ENGINE, **read_kwargs)
+    # Convert the date columns here rather than via parse_dates, which rejects the whole sheet if one
+    # is missing; unparseable cells become NaT
+    for col in [c for c in dates if c in df.columns]:
+        if not pd.api.types.is_datetime64_any_dtype(df[col]):
+            df[col] = pd.to_datetime(df[col], errors='coerce')
+    df = stringify_mixed_columns(df)
+    
+    # The cache is best-effort: a read-only directory just means no caching
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Drop entries for older versions of this sheet
+        stale = re.compile(rf"{re.escape(safe_name)}_[0-9a-f]{{40}}\.parquet")
+        for entry in os.listdir(CACHE_DIR):
+            if stale.fullmatch(entry) and entry != os.path.basename(path):
+                os.remove(os.path.join(CACHE_DIR, entry))
+        df.to_parquet(path, compression='zstd')
+    except Exception:
+        pass
+    
+    return df
+
+def load_historical_sheet(filename, sheet_name, file_hash):
+    """Read one sheet of the historical workbook through the Parquet cache"""
+    return read_excel_cached(filename, sheet_name, f"historical_{sheet_name}", file_hash, dtype=SHEET_DTYPES['historical'],
+                             dates=SHEET_DATES.get(sheet_name, []))
+
+@st.cache_data(show_spinner="Loading sheet...")
+def load_sheet(filename, sheet_name):
+    """Lazily load a historical sheet that isn't read at startup"""
+    return load_historical_sheet(filename, sheet_name, file_sha1(filename))
+
+def load_excel_file(key, filename):
+    """Load one local Excel file, returning the entries it adds to the data dict"""
+    try:
+        if os.path.exists(filename):
+            file_hash = file_sha1(filename)
+            if key == 'historical':
+                # Only the main sheet feeds the tabs; the rest are read on demand by load_sheet
+                xl_file = pd.ExcelFile(filename, engine=EXCEL_ENGINE)
+                sheets = {}
+                if 'All Historical Data' in xl_file.sheet_names:
+                    sheets['All Historical Data'] = load_historical_sheet(filename, 'All Historical Data', file_hash)
+                return {key: sheets, 'historical_sheets': xl_file.sheet_names}
+            
+            # Load first sheet for other files
+            return {key: read_excel_cached(filename, 0, key, file_hash, dtype=SHEET_DTYPES[key],
+                                           dates=SHEET_DATES.get(key, []))}
+    except Exception:
+        pass  # An unreadable file is reported as not found
+    
+    return {key: None}
+
 @st.cache_data
 def load_local_excel_files():
-    """Load local Excel files with error handling"""
+    """Load local Excel files concurrently; a file that fails to load is None without affecting the others"""
     data = {}
     
     # Check if files exist in current directory
-    files = {
-        'historical': 'AllDataAnalysis_20250908_194306.xlsx',
-        'linguists': 'SOSiApprovedLinguists (1).xlsx',
-        'staging': 'tblStaging_Raw.xlsx'
-    }
-    
-    for key, filename in files.items():
-        try:
-            if os.path.exists(filename):
-                if key == 'historical':
-                    # Load all sheets from historical data
-                    xl_file = pd.ExcelFile(filename)
-                    data[key] = {}
-                    for sheet in xl_file.sheet_names:
-                        data[key][sheet] = pd.read_excel(filename, sheet_name=sheet)
-                else:
-                    # Load first sheet for other files
-                    data[key] = pd.read_excel(filename, sheet_name=0)
-            else:
-                data[key] = None
-        except Exception as e:
-            data[key] = None
+    with ThreadPoolExecutor(max_workers=len(EXCEL_FILES)) as executor:
+        futures = [executor.submit(load_excel_file, key, filename) for key, filename in EXCEL_FILES.items()]
+        # Collect in submission order so the dict keeps a stable key order
+        for future in futures:
+            data.update(future.result())
     
     return data
 
-# Data cleaning functions for SOSI data will be handled within each tab as needed
+def use_arrow_strings(df):
+    """Store plain-text object columns as Arrow-backed strings (already the default text dtype on pandas 3)"""
+    for col in df.select_dtypes(include='object').columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) == 'string':
+            df[col] = df[col].astype('string[pyarrow]')
+    return df
+
+@st.cache_data(show_spinner=False)
+def clean_historical(df):
+    """Sort historical requests by date so the Trends tab can slice date ranges with searchsorted"""
+    if df is None or 'Request Date' not in df.columns:
+        return df
+    
+    # Stable sort keeps the file order within a day; missing dates go last
+    return df.sort_values('Request Date', kind='stable').reset_index(drop=True)
+
+@st.cache_data(show_spinner=False)
+def clean_linguists(df):
+    """Clean and prepare linguist directory data"""
+    if df is None:
+        return None
+    
+    # Make a copy to avoid modifying cached data
+    df = df.copy()
+    
+    # Numeric rate alongside the free-text one (e.g. "$100/hour" stays readable in the table)
+    if 'Rate' in df.columns:
+        df['Rate (numeric)'] = pd.to_numeric(df['Rate'], errors='coerce', downcast='float')
+    
+    df = use_arrow_strings(df)
+    
+    # Sort the filter columns' categories once so the selectboxes can list them as-is
+    for col in LINGUIST_FILTER_COLUMNS:
+        if col in df.columns:
+            categories = df[col].astype('category').cat.categories
+            df[col] = df[col].astype(pd.CategoricalDtype(sorted(categories)))
+    
+    return df
+
+@st.cache_data(show_spinner=False)
+def clean_staging(df):
+    """Clean and prepare staging data"""
+    if df is None:
+        return None
+    
+    # Make a copy to avoid modifying cached data
+    df = df.copy()
+    
+    # Convert billable time to numeric
+    if 'Billable time' in df.columns:
+        df['Billable time (numeric)'] = pd.to_numeric(df['Billable time'], errors='coerce', downcast='float')
+    
+    df = use_arrow_strings(df)
+    
+    # Flag completed services once: match the handful of distinct statuses, then map rows by category code
+    if 'Status' in df.columns:
+        status = df['Status'].astype('category')
+        completed_statuses = [c for c in status.cat.categories if any(k in str(c).lower() for k in COMPLETED_STATUS_KEYWORDS)]
+        df['is_completed'] = status.isin(completed_statuses)
+    
+    return df
+
+def overview_stats(hist_df, ling_df, staging_df):
+    """Headline numbers for the Overview tab in one pass, with "N/A" for missing data"""
+    stats = {'requests': "N/A", 'linguists': "N/A", 'languages': "N/A", 'completed': "N/A"}
+    
+    if hist_df is not None:
+        stats['requests'] = len(hist_df)
+        if 'Language' in hist_df.columns:
+            stats['languages'] = hist_df['Language'].nunique()
+    
+    if ling_df is not None:
+        stats['linguists'] = len(ling_df)
+    
+    if staging_df is not None and 'is_completed' in staging_df.columns:
+        stats['completed'] = int(staging_df['is_completed'].sum())
+    
+    return stats
+
+def linguist_filter_options(df):
+    """Choices for each linguist directory filter column, read from the (pre-sorted) category index"""
+    if df is None:
+        return {}
+    
+    return {
+        col: list(df[col].cat.categories)
+        for col in LINGUIST_FILTER_COLUMNS
+        if col in df.columns
+    }
+
+@st.cache_data(show_spinner=False)
+def make_monthly_trend(monthly_requests):
+    """Build the monthly requests line chart, cached on the counts it plots"""
+    fig = px.line(
+        x=monthly_requests.index,
+        y=monthly_requests.to_numpy(),
+        title="Monthly Service Requests",
+        render_mode=LINE_RENDER_MODE,
+        labels={'x': 'Month', 'y': 'Number of Requests'}
+    )
+    fig.update_traces(mode='lines+markers')
+    return fig
+
+@st.cache_data(show_spinner=False)
+def make_language_trend(lang_trend_df, top_languages):
+    """Build the top languages trend chart, cached on the monthly counts it plots"""
+    return px.line(
+        lang_trend_df,
+        x='Date',
+        y='Count',
+        color='Language',
+        category_orders={'Language': list(top_languages)},
+        title="Top 5 Languages - Request Trends",
+        render_mode=LINE_RENDER_MODE,
+        labels={'Count': 'Number of Requests', 'Date': 'Month'}
+    )
+
+@st.cache_data(show_spinner=False)
+def make_availability_pie(availability_counts):
+    """Build the overall linguist availability pie chart, cached on the counts it plots"""
+    return px.pie(
+        values=availability_counts.to_numpy(),
+        names=availability_counts.index,
+        title="Overall Linguist Availability",
+        color_discrete_map={'Yes': '#2E7D32', 'No': '#D32F2F'}
+    )
+
+@st.cache_data(show_spinner=False)
+def make_language_availability_bar(availability_pct):
+    """Build the availability-by-language bar chart, cached on the percentages it plots"""
+    fig = px.bar(
+        x=availability_pct.index,
+        y=availability_pct,
+        title="Linguist Availability by Top 10 Languages",
+        labels={'x': 'Language', 'y': 'Availability %'},
+        color=availability_pct,
+        color_continuous_scale='RdYlGn'
+    )
+    fig.add_hline(y=50, line_dash="dash", annotation_text="50% threshold")
+    return fig
+
+@st.fragment
+def show_paginated(df, key, page_size=1000):
+    """Display one page of a large frame so only that slice is sent to the browser"""
+    n_pages = max(1, -(-len(df) // page_size))
+    if n_pages > 1:
+        page = st.number_input(f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1, key=key)
+    else:
+        page = 1
+    
+    page_df = df.iloc[(page - 1) * page_size:page * page_size]
+    st.dataframe(page_df.drop(columns=DERIVED_COLUMNS, errors='ignore'), use_container_width=True)
+
+@st.cache_data(show_spinner=False)
+def to_csv_bytes(df):
+    """Serialize a frame for a download button, re-encoding only when the frame changes"""
+    return df.drop(columns=DERIVED_COLUMNS, errors='ignore').to_csv(index=False).encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def to_parquet_bytes(df):
+    """Serialize a frame as Parquet for a download button; smaller and much faster to write than CSV"""
+    return df.drop(columns=DERIVED_COLUMNS, errors='ignore').to_parquet(index=False, compression='zstd')
 
 # Load SOSI data files
 with st.spinner("Loading SOSI data files..."):
     local_data = load_local_excel_files()
 
+# Clean once per session; tabs read the typed frames from session state
+# (historical dates are already parsed at load time)
+if 'clean' not in st.session_state:
+    historical = local_data.get('historical')
+    requests_df = clean_historical(historical.get('All Historical Data')) if isinstance(historical, dict) else None
+    linguists = clean_linguists(local_data.get('linguists'))
+    staging = clean_staging(local_data.get('staging'))
+    st.session_state['clean'] = {
+        'historical': historical,
+        'historical_sheets': local_data.get('historical_sheets', []),
+        'requests': requests_df,
+        'linguists': linguists,
+        'linguist_options': linguist_filter_options(linguists),
+        'staging': staging,
+        'overview_stats': overview_stats(requests_df, linguists, staging)
+    }
+clean_data = st.session_state['clean']
+
 # Set API data to None since this is SOSI-specific
 lass_df = None
 lep_df = None
@@ -88,29 +378,29 @@ st.markdown('<h1 class="main-header">🗣️ SOSI Language Services Dashboard</h
 st.markdown("### Comprehensive Analysis of Language Services and Interpreter Management")
 
 # Display Excel file loading status
-if any(local_data.values()):
+if any(clean_data[key] is not None for key in EXCEL_FILES):
     with st.expander("📁 Local Excel Files Status", expanded=False):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if local_data.get('historical') is not None:
+            if clean_data.get('historical') is not None:
                 st.success("✅ Historical Data Loaded")
-                if isinstance(local_data['historical'], dict):
-                    st.write(f"Sheets: {', '.join(local_data['historical'].keys())}")
+                if isinstance(clean_data['historical'], dict):
+                    st.write(f"Sheets: {', '.join(clean_data['historical_sheets'])}")
             else:
                 st.error("❌ Historical Data Not Found")
                 
         with col2:
-            if local_data.get('linguists') is not None:
+            if clean_data.get('linguists') is not None:
                 st.success("✅ Linguist Directory Loaded")
-                st.write(f"Records: {len(local_data['linguists'])}")
+                st.write(f"Records: {len(clean_data['linguists'])}")
             else:
                 st.error("❌ Linguist Directory Not Found")
                 
         with col3:
-            if local_data.get('staging') is not None:
+            if clean_data.get('staging') is not None:
                 st.success("✅ Staging Data Loaded")
-                st.write(f"Records: {len(local_data['staging'])}")
+                st.write(f"Records: {len(clean_data['staging'])}")
             else:
                 st.error("❌ Staging Data Not Found")
 
@@ -122,40 +412,20 @@ with tab1:
     st.subheader("📊 SOSI Language Services Overview")
     
     # Quick stats from available data
+    stats = clean_data['overview_stats']
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if local_data.get('historical') and isinstance(local_data['historical'], dict):
-            hist_data = local_data['historical'].get('All Historical Data')
-            if hist_data is not None:
-                st.metric("Total Service Requests", len(hist_data))
-            else:
-                st.metric("Total Service Requests", "N/A")
-        else:
-            st.metric("Total Service Requests", "N/A")
+        st.metric("Total Service Requests", stats['requests'])
     
     with col2:
-        if local_data.get('linguists') is not None:
-            st.metric("Available Linguists", len(local_data['linguists']))
-        else:
-            st.metric("Available Linguists", "N/A")
+        st.metric("Available Linguists", stats['linguists'])
     
     with col3:
-        if local_data.get('historical') and isinstance(local_data['historical'], dict):
-            hist_data = local_data['historical'].get('All Historical Data')
-            if hist_data is not None and 'Language' in hist_data.columns:
-                st.metric("Languages Supported", hist_data['Language'].nunique())
-            else:
-                st.metric("Languages Supported", "N/A")
-        else:
-            st.metric("Languages Supported", "N/A")
+        st.metric("Languages Supported", stats['languages'])
     
     with col4:
-        if local_data.get('staging') is not None and 'Status' in local_data['staging'].columns:
-            completed = len(local_data['staging'][local_data['staging']['Status'].str.contains('completed|done', case=False, na=False)])
-            st.metric("Completed Services", completed)
-        else:
-            st.metric("Completed Services", "N/A")
+        st.metric("Completed Services", stats['completed'])
     
     st.markdown("---")
     st.markdown("""
@@ -179,17 +449,11 @@ with tab2:
     
     try:
         # Check if historical data is available
-        if local_data.get('historical') and isinstance(local_data['historical'], dict):
-            # Get the main historical data sheet
-            hist_data = local_data['historical'].get('All Historical Data')
+        if clean_data.get('historical') and isinstance(clean_data['historical'], dict):
+            # Get the main historical data sheet, sorted by request date
+            hist_data = clean_data['requests']
             
             if hist_data is not None and not hist_data.empty:
-                # Convert date columns to datetime
-                date_columns = ['Request Date', 'Hearing Date', 'Row Added']
-                for col in date_columns:
-                    if col in hist_data.columns:
-                        hist_data[col] = pd.to_datetime(hist_data[col], errors='coerce')
-                
                 # Check if we have valid dates
                 if 'Request Date' in hist_data.columns and not hist_data['Request Date'].isna().all():
                     # Time range filter
@@ -230,12 +494,14 @@ with tab2:
                         else:
                             end_date = st.date_input("End Date")
                     
-                    # Filter data by date range
+                    # Filter data by date range: binary-search the sorted dates instead of masking every row
                     try:
-                        mask = (hist_data['Request Date'].dt.date >= start_date) & (hist_data['Request Date'].dt.date <= end_date)
-                        filtered_hist = hist_data[mask].copy()
+                        request_dates = hist_data['Request Date'].to_numpy()
+                        lo = request_dates.searchsorted(np.datetime64(start_date))
+                        hi = request_dates.searchsorted(np.datetime64(end_date + timedelta(days=1)))
+                        filtered_hist = hist_data.iloc[lo:hi]
                     except:
-                        filtered_hist = hist_data.copy()
+                        filtered_hist = hist_data
                     
                     # Trend visualizations
                     st.markdown("---")
@@ -246,16 +512,9 @@ with tab2:
                         
                         try:
                             # Group by month
-                            monthly_requests = filtered_hist.groupby(filtered_hist['Request Date'].dt.to_period('M')).size()
-                            monthly_requests.index = monthly_requests.index.to_timestamp()
+                            monthly_requests = filtered_hist.groupby(pd.Grouper(key='Request Date', freq='MS')).size()
                             
-                            fig_trend = px.line(
-                                x=monthly_requests.index,
-                                y=monthly_requests.values,
-                                title="Monthly Service Requests",
-                                labels={'x': 'Month', 'y': 'Number of Requests'}
-                            )
-                            fig_trend.update_traces(mode='lines+markers')
+                            fig_trend = make_monthly_trend(monthly_requests)
                             st.plotly_chart(fig_trend, use_container_width=True)
                         except Exception as e:
                             st.error(f"Error creating time series chart: {str(e)}")
@@ -266,32 +525,22 @@ with tab2:
                         
                         try:
                             # Top languages over time
-                            top_languages = filtered_hist['Language'].value_counts().head(5).index
-                            lang_trend_data = []
+                            # (ties broken by language name, so the legend doesn't depend on value_counts' tie order)
+                            lang_counts = filtered_hist['Language'].value_counts().loc[lambda c: c > 0]
+                            top_languages = lang_counts.sort_index(key=lambda idx: idx.astype(str)).sort_values(ascending=False, kind='stable').head(5).index
+                            top_hist = filtered_hist.loc[filtered_hist['Language'].isin(top_languages), ['Request Date', 'Language']]
                             
-                            for lang in top_languages:
-                                lang_data = filtered_hist[filtered_hist['Language'] == lang]
-                                monthly = lang_data.groupby(lang_data['Request Date'].dt.to_period('M')).size()
-                                monthly.index = monthly.index.to_timestamp()
-                                
-                                for date, count in monthly.items():
-                                    lang_trend_data.append({
-                                        'Date': date,
-                                        'Language': lang,
-                                        'Count': count
-                                    })
+                            # Monthly counts per language in one grouped pass
+                            lang_trend_df = (
+                                top_hist.groupby([pd.Grouper(key='Request Date', freq='MS'), 'Language'], observed=True)
+                                .size()
+                                .rename('Count')
+                                .reset_index()
+                                .rename(columns={'Request Date': 'Date'})
+                            )
                             
-                            if lang_trend_data:
-                                lang_trend_df = pd.DataFrame(lang_trend_data)
-                                
-                                fig_lang_trend = px.line(
-                                    lang_trend_df,
-                                    x='Date',
-                                    y='Count',
-                                    color='Language',
-                                    title="Top 5 Languages - Request Trends",
-                                    labels={'Count': 'Number of Requests', 'Date': 'Month'}
-                                )
+                            if not lang_trend_df.empty:
+                                fig_lang_trend = make_language_trend(lang_trend_df, tuple(top_languages))
                                 st.plotly_chart(fig_lang_trend, use_container_width=True)
                         except Exception as e:
                             st.error(f"Error creating language trends chart: {str(e)}")
@@ -304,15 +553,14 @@ with tab2:
                         
                         with col1:
                             try:
-                                # Overall availability
-                                availability_counts = filtered_hist['Has Linguist?'].value_counts()
+                                # Overall availability: a bincount over the codes of this two-or-three-level categorical
+                                has_linguist = filtered_hist['Has Linguist?']
+                                codes = has_linguist.cat.codes.to_numpy()
+                                counts = np.bincount(codes[codes >= 0], minlength=len(has_linguist.cat.categories))
+                                availability_counts = pd.Series(counts, index=has_linguist.cat.categories)
+                                availability_counts = availability_counts[availability_counts > 0].sort_values(ascending=False, kind='stable')
                                 
-                                fig_avail = px.pie(
-                                    values=availability_counts.values,
-                                    names=availability_counts.index,
-                                    title="Overall Linguist Availability",
-                                    color_discrete_map={'Yes': '#2E7D32', 'No': '#D32F2F'}
-                                )
+                                fig_avail = make_availability_pie(availability_counts)
                                 st.plotly_chart(fig_avail, use_container_width=True)
                             except Exception as e:
                                 st.error(f"Error creating availability chart: {str(e)}")
@@ -321,21 +569,13 @@ with tab2:
                             try:
                                 # Availability by language
                                 if 'Language' in filtered_hist.columns:
-                                    lang_avail = filtered_hist.groupby(['Language', 'Has Linguist?']).size().unstack(fill_value=0)
+                                    lang_avail = filtered_hist.groupby(['Language', 'Has Linguist?'], observed=True).size().unstack(fill_value=0)
                                     lang_avail['Total'] = lang_avail.sum(axis=1)
                                     lang_avail['Availability %'] = (lang_avail.get('Yes', 0) / lang_avail['Total'] * 100).round(1)
                                     
                                     top_lang_avail = lang_avail.nlargest(10, 'Total')
                                     
-                                    fig_lang_avail = px.bar(
-                                        x=top_lang_avail.index,
-                                        y=top_lang_avail['Availability %'],
-                                        title="Linguist Availability by Top 10 Languages",
-                                        labels={'x': 'Language', 'y': 'Availability %'},
-                                        color=top_lang_avail['Availability %'],
-                                        color_continuous_scale='RdYlGn'
-                                    )
-                                    fig_lang_avail.add_hline(y=50, line_dash="dash", annotation_text="50% threshold")
+                                    fig_lang_avail = make_language_availability_bar(top_lang_avail['Availability %'])
                                     st.plotly_chart(fig_lang_avail, use_container_width=True)
                             except Exception as e:
                                 st.error(f"Error creating language availability chart: {str(e)}")
@@ -355,15 +595,16 @@ with tab2:
 with tab3:
     st.subheader("👥 Linguist Directory")
     
-    if local_data.get('linguists') is not None:
-        linguists_df = local_data['linguists']
+    if clean_data.get('linguists') is not None:
+        linguists_df = clean_data['linguists']
+        filter_options = clean_data['linguist_options']
         
         # Filters for linguist directory
         col1, col2, col3 = st.columns(3)
         
         with col1:
             if 'Languages' in linguists_df.columns:
-                unique_languages = sorted(linguists_df['Languages'].dropna().unique())
+                unique_languages = filter_options['Languages']
                 selected_ling_language = st.selectbox(
                     "Filter by Language",
                     ["All"] + unique_languages
@@ -371,7 +612,7 @@ with tab3:
         
         with col2:
             if 'State' in linguists_df.columns:
-                unique_states = sorted(linguists_df['State'].dropna().unique())
+                unique_states = filter_options['State']
                 selected_state = st.selectbox(
                     "Filter by State",
                     ["All"] + unique_states
@@ -379,23 +620,25 @@ with tab3:
         
         with col3:
             if 'Proficiency' in linguists_df.columns:
-                unique_prof = sorted(linguists_df['Proficiency'].dropna().unique())
+                unique_prof = filter_options['Proficiency']
                 selected_prof = st.selectbox(
                     "Filter by Proficiency",
                     ["All"] + unique_prof
                 )
         
-        # Apply filters
-        filtered_linguists = linguists_df.copy()
+        # Apply filters: combine the selections into one mask and gather the rows once
+        mask = np.ones(len(linguists_df), dtype=bool)
         
         if selected_ling_language != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['Languages'] == selected_ling_language]
+            mask &= (linguists_df['Languages'] == selected_ling_language).to_numpy()
         
         if selected_state != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['State'] == selected_state]
+            mask &= (linguists_df['State'] == selected_state).to_numpy()
         
         if selected_prof != "All":
-            filtered_linguists = filtered_linguists[filtered_linguists['Proficiency'] == selected_prof]
+            mask &= (linguists_df['Proficiency'] == selected_prof).to_numpy()
+        
+        filtered_linguists = linguists_df.iloc[mask]
         
         # Summary statistics
         st.markdown("---")
@@ -414,7 +657,7 @@ with tab3:
         
         with col4:
             if 'Rate' in filtered_linguists.columns:
-                avg_rate = pd.to_numeric(filtered_linguists['Rate'], errors='coerce').mean()
+                avg_rate = filtered_linguists['Rate (numeric)'].mean()
                 if not pd.isna(avg_rate):
                     st.metric("Average Rate", f"${avg_rate:.2f}")
         
@@ -426,7 +669,7 @@ with tab3:
         with col1:
             st.markdown("#### Languages Distribution")
             if 'Languages' in filtered_linguists.columns:
-                lang_counts = filtered_linguists['Languages'].value_counts().head(15)
+                lang_counts = filtered_linguists['Languages'].value_counts().loc[lambda c: c > 0].head(15)
                 
                 fig_lang_dist = px.bar(
                     y=lang_counts.index,
@@ -440,7 +683,7 @@ with tab3:
         with col2:
             st.markdown("#### Geographic Distribution")
             if 'State' in filtered_linguists.columns:
-                state_counts = filtered_linguists['State'].value_counts()
+                state_counts = filtered_linguists['State'].value_counts().loc[lambda c: c > 0]
                 
                 fig_state_dist = px.pie(
                     values=state_counts.values,
@@ -467,10 +710,16 @@ with tab3:
         # Download button
         st.download_button(
             label="Download Filtered Linguist Data",
-            data=filtered_linguists.to_csv(index=False),
+            data=to_csv_bytes(filtered_linguists),
             file_name="filtered_linguists.csv",
             mime="text/csv"
         )
+        st.download_button(
+            label="Download Filtered Linguist Data (Parquet)",
+            data=to_parquet_bytes(filtered_linguists),
+            file_name="filtered_linguists.parquet",
+            mime="application/octet-stream"
+        )
         
     else:
         st.warning("Linguist directory file not found. Please ensure 'SOSiApprovedLinguists (1).xlsx' is in the same directory as the app.")
@@ -480,17 +729,11 @@ with tab3:
 with tab4:
     st.subheader("📋 Comprehensive Data Analysis")
     
-    if local_data.get('staging') is not None:
-        staging_df = local_data['staging']
+    if clean_data.get('staging') is not None:
+        staging_df = clean_data['staging']
         
         st.markdown("### 📊 Staging Data Analysis")
         
-        # Convert date columns
-        date_cols = ['Date of request', 'Hearing Date', 'Timestamp']
-        for col in date_cols:
-            if col in staging_df.columns:
-                staging_df[col] = pd.to_datetime(staging_df[col], errors='coerce')
-        
         # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
@@ -545,7 +788,7 @@ with tab4:
             with col2:
                 if 'Language' in staging_df.columns:
                     # Top languages by medium
-                    lang_medium = staging_df.groupby(['Medium', 'Language']).size().reset_index(name='Count')
+                    lang_medium = staging_df.groupby(['Medium', 'Language'], observed=True).size().reset_index(name='Count')
                     top_langs = staging_df['Language'].value_counts().head(5).index
                     lang_medium_filtered = lang_medium[lang_medium['Language'].isin(top_langs)]
                     
@@ -564,9 +807,6 @@ with tab4:
             st.markdown("---")
             st.markdown("#### Service Duration Analysis")
             
-            # Convert billable time to numeric
-            staging_df['Billable time (numeric)'] = pd.to_numeric(staging_df['Billable time'], errors='coerce')
-            
             if not staging_df['Billable time (numeric)'].isna().all():
                 col1, col2 = st.columns(2)
                 
@@ -582,7 +822,7 @@ with tab4:
                 
                 with col2:
                     if 'Language' in staging_df.columns:
-                        avg_time_by_lang = staging_df.groupby('Language')['Billable time (numeric)'].mean().sort_values(ascending=False).head(10)
+                        avg_time_by_lang = staging_df.groupby('Language', observed=True)['Billable time (numeric)'].mean().sort_values(ascending=False).head(10)
                         
                         fig_avg_time = px.bar(
                             x=avg_time_by_lang.values,
@@ -600,36 +840,65 @@ with tab4:
     data_tabs = st.tabs(["Historical Data", "Linguist Data", "Staging Data"])
     
     with data_tabs[0]:
-        if local_data.get('historical') and isinstance(local_data['historical'], dict):
-            for sheet_name, sheet_data in local_data['historical'].items():
-                st.write(f"Sheet: {sheet_name}")
-                st.dataframe(sheet_data, use_container_width=True)
+        if clean_data['historical_sheets']:
+            # Only the selected sheet is read; sheets not loaded at startup are parsed on first view
+            sheet_name = st.selectbox("Sheet", clean_data['historical_sheets'], key="hist_sheet")
+            sheet_data = clean_data['historical'].get(sheet_name)
+            if sheet_data is None:
+                try:
+                    sheet_data = load_sheet(EXCEL_FILES['historical'], sheet_name)
+                except Exception as e:
+                    st.error(f"Error loading sheet '{sheet_name}': {str(e)}")
+            
+            if sheet_data is not None:
+                if st.checkbox(f"Show {sheet_name}", key=f"show_hist_{sheet_name}"):
+                    show_paginated(sheet_data, key=f"hist_page_{sheet_name}", page_size=500)
                 st.download_button(
                     label=f"Download {sheet_name}",
-                    data=sheet_data.to_csv(index=False),
+                    data=to_csv_bytes(sheet_data),
                     file_name=f"historical_{sheet_name.replace(' ', '_')}.csv",
                     mime="text/csv"
                 )
+                st.download_button(
+                    label=f"Download {sheet_name} (Parquet)",
+                    data=to_parquet_bytes(sheet_data),
+                    file_name=f"historical_{sheet_name.replace(' ', '_')}.parquet",
+                    mime="application/octet-stream"
+                )
     
     with data_tabs[1]:
-        if local_data.get('linguists') is not None:
-            st.dataframe(local_data['linguists'], use_container_width=True)
+        if clean_data.get('linguists') is not None:
+            if st.checkbox("Show Linguist Data", key="show_linguists"):
+                show_paginated(clean_data['linguists'], key="linguist_page", page_size=500)
             st.download_button(
                 label="Download Linguist Data",
-                data=local_data['linguists'].to_csv(index=False),
+                data=to_csv_bytes(clean_data['linguists']),
                 file_name="linguist_data.csv",
                 mime="text/csv"
             )
+            st.download_button(
+                label="Download Linguist Data (Parquet)",
+                data=to_parquet_bytes(clean_data['linguists']),
+                file_name="linguist_data.parquet",
+                mime="application/octet-stream"
+            )
     
     with data_tabs[2]:
-        if local_data.get('staging') is not None:
-            st.dataframe(local_data['staging'], use_container_width=True)
+        if clean_data.get('staging') is not None:
+            if st.checkbox("Show Staging Data", key="show_staging"):
+                show_paginated(clean_data['staging'], key="staging_page", page_size=500)
             st.download_button(
                 label="Download Staging Data",
-                data=local_data['staging'].to_csv(index=False),
+                data=to_csv_bytes(clean_data['staging']),
                 file_name="staging_data.csv",
                 mime="text/csv"
             )
+            st.download_button(
+                label="Download Staging Data (Parquet)",
+                data=to_parquet_bytes(clean_data['staging']),
+                file_name="staging_data.parquet",
+                mime="application/octet-stream"
+            )
 
 # Footer
 st.markdown("---")